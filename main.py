@@ -3,9 +3,12 @@
 
 """
 Watch Kaggle competition submissions and post status updates to Slack.
-- One unified interval (--interval-min) controls both polling and reporting.
+- One unified interval (--interval-min) controls both polling and reporting while idle.
+- Polling speeds up while any submission is pending/queued/running.
 - Slack webhook, competition slug, and interval are CLI args.
 - Kaggle authentication uses kaggle.json or environment defaults.
+- With --event-url, pushed events trigger an immediate refresh and polling becomes a slow safety net.
+- Submissions are listed via the Kaggle REST API directly; --use-sdk switches to the kaggle package.
 - All comments are in English.
 """
 
@@ -15,15 +18,58 @@ import datetime
 from datetime import timezone, timedelta
 import time
 import os
+import random
+import re
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 import requests
-from typing import Any, Dict, Optional, List
-from kaggle.api.kaggle_api_extended import KaggleApi
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+from typing import Any, Dict, Optional, List, Tuple
+
+try:  # optional: faster encoding of large block payloads
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 
 # =========================
 # Slack
 # =========================
+SLACK_MAX_BLOCKS = 50          # Slack rejects messages with more blocks than this
+SLACK_MAX_SECTION_TEXT = 3000  # Slack limit for a section block's text
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_COMPLETE_HEADER_BLOCK = {"type": "section", "text": {"type": "mrkdwn", "text": ":white_check_mark: *Kaggle Submission Complete*"}}
+
+
+def _make_session(retry_methods: frozenset, retry_reads: bool = True) -> requests.Session:
+    """Create a keep-alive session so requests reuse one TLS connection per host."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        # A POST that hit a read error may already have been accepted; resending would duplicate it
+        read=None if retry_reads else 0,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=retry_methods,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SLACK_SESSION = _make_session(frozenset({"POST"}), retry_reads=False)
+# Single worker: posts leave the polling thread but still arrive in order
+_SLACK_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slack-post")
+
+
 def slack_post(webhook_url: str, text: str, blocks: Optional[List[dict]] = None) -> None:
     """Post a message to Slack via incoming webhook."""
     if not webhook_url:
@@ -33,31 +79,98 @@ def slack_post(webhook_url: str, text: str, blocks: Optional[List[dict]] = None)
     if blocks:
         payload["blocks"] = blocks
     try:
-        resp = requests.post(
-            webhook_url,
-            data=json.dumps(payload),
-            headers={"Content-Type": "application/json"},
-            timeout=10
-        )
+        resp = _SLACK_SESSION.post(webhook_url, data=_dumps(payload), headers=_JSON_HEADERS, timeout=10)
         resp.raise_for_status()
     except Exception as e:
         print("[Slack post failed]", e)
 
 
+def text_block(text: str) -> dict:
+    """Wrap plain mrkdwn text into a section block."""
+    if len(text) > SLACK_MAX_SECTION_TEXT:
+        text = text[:SLACK_MAX_SECTION_TEXT - 1] + "…"
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def _build_complete_blocks(ref: int, el_min: int, submitted_jst: str, score_line: str, link: str) -> List[dict]:
+    """Fill the dynamic fields of the 'submission complete' block template."""
+    return [
+        _COMPLETE_HEADER_BLOCK,
+        {"type": "section", "fields": [
+            {"type": "mrkdwn", "text": f"*Ref:*\n`{ref}`"},
+            {"type": "mrkdwn", "text": f"*Elapsed (Submit→Now):*\n{el_min} min"},
+            {"type": "mrkdwn", "text": f"*Submitted (JST):*\n{submitted_jst}"},
+        ]},
+        {"type": "section", "text": {"type": "mrkdwn", "text": score_line}},
+        {"type": "context", "elements": [{"type": "mrkdwn", "text": f"<{link}|Open submission>"}]}
+    ]
+
+
+def slack_post_batch(webhook_url: str, messages: List[Tuple[str, List[dict]]]) -> None:
+    """Coalesce (fallback text, blocks) messages into as few Slack posts as possible."""
+    pending_msgs: List[str] = []
+    pending_blocks: List[dict] = []
+    for text, blocks in messages:
+        extra = len(blocks) + (1 if pending_blocks else 0)
+        if pending_blocks and len(pending_blocks) + extra > SLACK_MAX_BLOCKS:
+            slack_post(webhook_url, text="\n".join(pending_msgs), blocks=pending_blocks)
+            pending_msgs, pending_blocks = [], []
+        if pending_blocks:
+            pending_blocks.append({"type": "divider"})
+        pending_msgs.append(text)
+        pending_blocks.extend(blocks)
+    if pending_blocks:
+        slack_post(webhook_url, text="\n".join(pending_msgs), blocks=pending_blocks)
+
+
+def slack_post_background(webhook_url: str, messages: List[Tuple[str, List[dict]]]) -> None:
+    """Queue a batch for delivery without blocking the polling loop."""
+    if messages:
+        _SLACK_EXECUTOR.submit(slack_post_batch, webhook_url, messages)
+
+
+def slack_flush() -> None:
+    """Wait until every queued Slack post has been delivered."""
+    _SLACK_EXECUTOR.shutdown(wait=True)
+
+
 # =========================
 # Utilities
 # =========================
+_UTC = timezone.utc
+_JST = timezone(timedelta(hours=9))
+
+
+_MISSING = object()
+_SENTINELS = frozenset((None, "", "-", "—"))
+_COMPLETE_NAMES = frozenset(("completed", "complete"))
+_PENDING_NAMES = frozenset(("uploading",))
+_NON_DIGITS_RE = re.compile(r"\D+")
+_FRACTION_RE = re.compile(r"\.(\d+)")
+
+
+def _is_blank(v: Any) -> bool:
+    """True for placeholder values Kaggle uses for 'no value'."""
+    try:
+        return v in _SENTINELS
+    except TypeError:  # unhashable values are never placeholders
+        return False
+
+
 def get_attr(s: Any, *names, default=None):
-    """Safely read both underscore and non-underscore attributes."""
-    for name in names:
-        if hasattr(s, name):
-            v = getattr(s, name)
-            if v not in (None, "", "-", "—"):
+    """Safely read both underscore and non-underscore attributes (or keys of a JSON dict)."""
+    d = s if isinstance(s, dict) else getattr(s, "__dict__", None)
+    if d is not None:
+        for name in names:
+            v = d.get(name, _MISSING)
+            if v is not _MISSING and not _is_blank(v):
                 return v
-    d = getattr(s, "__dict__", {})
+        if d is s:
+            return default
     for name in names:
-        if name in d and d[name] not in (None, "", "-", "—"):
-            return d[name]
+        v = getattr(s, name, _MISSING)
+        if v is not _MISSING and not _is_blank(v):
+            return v
     return default
 
 
@@ -67,32 +180,41 @@ def get_ref(s: Any) -> int:
     try:
         return int(r)
     except Exception:
-        rs = str(r)
-        digits = "".join(ch for ch in rs if ch.isdigit())
+        digits = _NON_DIGITS_RE.sub("", str(r))
         return int(digits) if digits else -1
 
 
-def status_text(s: Any) -> str:
-    """Normalize status string."""
-    st = get_attr(s, "_status", "status", default="")
+@lru_cache(maxsize=64)
+def _normalize_status(st: Any) -> str:
+    """Normalize a raw status value; cached because only a few distinct values exist."""
     try:
         name = st.name
     except AttributeError:
         name = str(st)
     name_lower = name.replace("SubmissionStatus.", "").lower()
-    if name_lower in {"completed", "complete"}:
+    if name_lower in _COMPLETE_NAMES:
         return "complete"
-    if name_lower in {"uploading"}:
+    if name_lower in _PENDING_NAMES:
         return "pending"
     return name_lower
 
 
+def status_text(s: Any) -> str:
+    """Normalize status string."""
+    st = get_attr(s, "_status", "status", default="")
+    try:
+        return _normalize_status(st)
+    except TypeError:  # unhashable status value
+        return _normalize_status.__wrapped__(st)
+
+
 def score_display(s: Any) -> str:
     """Format score display for Public/Private LB."""
     pub = get_attr(s, "_public_score", "publicScore", "publicScoreDisplay", "scoreDisplay")
     prv = get_attr(s, "_private_score", "privateScore", "privateScoreDisplay")
-    pub_str = None if pub in (None, "", "-", "—") else f"{pub}"
-    prv_str = None if prv in (None, "", "-", "—") else f"{prv}"
+    # get_attr already returns None for placeholder values
+    pub_str = None if pub is None else f"{pub}"
+    prv_str = None if prv is None else f"{prv}"
     if pub_str and prv_str:
         return f"Public LB: *{pub_str}* / Private LB: *{prv_str}*"
     if pub_str:
@@ -102,10 +224,23 @@ def score_display(s: Any) -> str:
     return "Public LB: (N/A)"
 
 
-def fmt_jst(dt_utc_naive: datetime.datetime) -> str:
-    """Convert UTC naive datetime to JST formatted string."""
-    jst = dt_utc_naive.replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=9)))
-    return jst.strftime('%Y-%m-%d %H:%M:%S')
+def parse_utc(v: Any) -> Optional[datetime.datetime]:
+    """Return an aware UTC datetime from an SDK datetime or an ISO 8601 string (naive = UTC)."""
+    if isinstance(v, str):
+        # fromisoformat before 3.11 only takes 3 or 6 fraction digits; Kaggle sends 1-7
+        v = _FRACTION_RE.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), v.replace("Z", "+00:00"), count=1)
+        try:
+            v = datetime.datetime.fromisoformat(v)
+        except ValueError:
+            return None
+    if not isinstance(v, datetime.datetime):
+        return None
+    return v.replace(tzinfo=_UTC) if v.tzinfo is None else v.astimezone(_UTC)
+
+
+def fmt_jst(dt_utc: datetime.datetime) -> str:
+    """Convert an aware datetime to JST formatted string."""
+    return dt_utc.astimezone(_JST).strftime('%Y-%m-%d %H:%M:%S')
 
 
 def submission_url(s: Any, competition: str) -> str:
@@ -117,7 +252,7 @@ def submission_url(s: Any, competition: str) -> str:
 
 
 def elapsed_minutes(from_dt: datetime.datetime, to_dt: datetime.datetime) -> int:
-    """Return elapsed minutes (>=1)."""
+    """Return elapsed minutes (>=1) between two aware datetimes."""
     mins = int((to_dt - from_dt).total_seconds() // 60)
     return max(1, mins)
 
@@ -125,17 +260,306 @@ def elapsed_minutes(from_dt: datetime.datetime, to_dt: datetime.datetime) -> int
 # =========================
 # Core Logic
 # =========================
-def authenticate_kaggle() -> KaggleApi:
+ACTIVE_STATUSES = {"pending", "queued", "running"}
+TERMINAL_STATUSES = {"complete", "error"}
+ACTIVE_INTERVAL_SEC = 15
+TERMINAL_GRACE_CYCLES = 2
+UNLISTED_GRACE_CYCLES = 10     # a short or empty page must not make the watcher forget a ref
+FINISHED_REFS_MAX = 1000       # far more than one listing page; oldest finished refs are forgotten first
+JITTER = 0.15
+EVENT_SAFETY_FACTOR = 4        # idle polling interval multiplier while an event stream is connected
+EVENT_RECONNECT_MAX_SEC = 300
+EVENT_READ_TIMEOUT_SEC = 120   # the relay is expected to send keep-alives more often than this
+# Set by the event thread to cut the current sleep short
+_WAKE = threading.Event()
+# Set while the event stream is connected; polling only slows down while it is
+_EVENT_CONNECTED = threading.Event()
+
+
+@dataclass(slots=True)
+class TrackEntry:
+    """Tracking state for one submission ref."""
+    submit_time: datetime.datetime
+    submit_jst: str
+    url: str
+    last_seen_status: str
+    last_reported_status: Optional[str]
+    terminal_cycles: int = 0
+    missing_cycles: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "submit_time": self.submit_time.isoformat(),
+            "submit_jst": self.submit_jst,
+            "url": self.url,
+            "last_seen_status": self.last_seen_status,
+            "last_reported_status": self.last_reported_status,
+            "terminal_cycles": self.terminal_cycles,
+            "missing_cycles": self.missing_cycles,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "TrackEntry":
+        submit_time = parse_utc(d["submit_time"])
+        if submit_time is None:
+            raise ValueError(f"bad submit_time {d['submit_time']!r}")
+        return cls(
+            submit_time=submit_time,
+            submit_jst=d["submit_jst"],
+            url=d["url"],
+            last_seen_status=d["last_seen_status"],
+            last_reported_status=d["last_reported_status"],
+            terminal_cycles=d.get("terminal_cycles", 0),
+            missing_cycles=d.get("missing_cycles", 0),
+        )
+
+
+def remember_finished(finished_refs: Dict[int, None], ref: int) -> None:
+    """Add ref to the insertion-ordered finished set, evicting the oldest beyond the cap."""
+    finished_refs[ref] = None
+    while len(finished_refs) > FINISHED_REFS_MAX:
+        del finished_refs[next(iter(finished_refs))]
+
+
+def jittered(seconds: float) -> float:
+    """Apply uniform random jitter so retries do not synchronize."""
+    return seconds * random.uniform(1 - JITTER, 1 + JITTER)
+
+
+def _event_ref(line: Any) -> Optional[int]:
+    """Parse one JSON-lines or SSE 'data:' line into a ref (-1 if the event names none)."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="replace")
+    line = line.strip()
+    if line.startswith("data:"):
+        line = line[len("data:"):].strip()
+    if not line.startswith("{"):
+        return None  # blank keep-alives, SSE comments and 'event:' lines
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return None
+    return get_ref(event)
+
+
+def stream_events(event_url: str) -> None:
+    """Read the event stream forever, waking the watcher per event; reconnects with backoff."""
+    backoff = 1
+    while True:
+        try:
+            with requests.get(event_url, stream=True, timeout=(5, EVENT_READ_TIMEOUT_SEC)) as resp:
+                resp.raise_for_status()
+                _EVENT_CONNECTED.set()
+                # ndjson/jsonl relays often declare no charset; without one iter_lines yields bytes
+                resp.encoding = resp.encoding or "utf-8"
+                backoff = 1
+                for line in resp.iter_lines(decode_unicode=True):
+                    ref = _event_ref(line or "")
+                    # Heartbeats like {} and events for other competitions carry no ref
+                    if ref is not None and ref != -1:
+                        _WAKE.set()
+        except Exception as e:
+            print("[WARN] Event stream error:", e)
+        _EVENT_CONNECTED.clear()
+        time.sleep(jittered(backoff))
+        backoff = min(backoff * 2, EVENT_RECONNECT_MAX_SEC)
+
+
+def start_event_listener(event_url: str) -> None:
+    """Start the background event reader."""
+    threading.Thread(target=stream_events, args=(event_url,), name="event-stream", daemon=True).start()
+
+
+def wait_for_wake(not_before: float, deadline: float) -> None:
+    """Sleep until the monotonic deadline or an event; an event never ends the sleep before not_before."""
+    remaining = deadline - time.monotonic()
+    if remaining > 0 and _WAKE.wait(timeout=remaining):
+        floor = not_before - time.monotonic()
+        if floor > 0:
+            time.sleep(floor)
+    # Cleared last: events during the floor are covered by the poll that follows
+    _WAKE.clear()
+
+
+def _validators_from(headers: Any) -> Dict[str, str]:
+    """Turn ETag/Last-Modified response headers into conditional request headers."""
+    validators = {}
+    etag = headers.get("ETag")
+    if etag:
+        validators["If-None-Match"] = etag
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    return validators
+
+
+class _NotModified(Exception):
+    """Raised by the conditional-request cache when the server answers 304."""
+
+
+class _ConditionalPoolManager:
+    """Wrap the SDK's urllib3 pool manager to send ETag/Last-Modified validators on GET."""
+
+    def __init__(self, inner: Any):
+        self._inner = inner
+        self._validators: Dict[str, Dict[str, str]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    def clear(self) -> None:
+        self._validators.clear()
+
+    def request(self, method: str, url: str, *args, **kwargs):
+        if method.upper() != "GET":
+            return self._inner.request(method, url, *args, **kwargs)
+        key = f"{url}?{kwargs.get('fields')!r}"
+        headers = dict(kwargs.get("headers") or {})
+        headers.update(self._validators.get(key, {}))
+        kwargs["headers"] = headers
+
+        resp = self._inner.request(method, url, *args, **kwargs)
+        if resp.status == 304:
+            # The response never reaches the SDK, so return its connection to the pool here
+            drain_conn = getattr(resp, "drain_conn", None)  # urllib3 >= 1.26
+            if drain_conn is not None:
+                drain_conn()
+            resp.release_conn()
+            raise _NotModified(url)
+        if 200 <= resp.status < 300:
+            validators = _validators_from(resp.headers)
+            if validators:
+                self._validators[key] = validators
+            else:
+                self._validators.pop(key, None)
+        return resp
+
+
+KAGGLE_API_BASE = "https://www.kaggle.com/api/v1"
+
+
+def load_kaggle_credentials() -> Tuple[str, str]:
+    """Read Kaggle credentials from env vars or kaggle.json, like the SDK does."""
+    username = os.environ.get("KAGGLE_USERNAME")
+    key = os.environ.get("KAGGLE_KEY")
+    if username and key:
+        return username, key
+    config_dir = os.environ.get("KAGGLE_CONFIG_DIR") or os.path.join(os.path.expanduser("~"), ".kaggle")
+    path = os.path.join(config_dir, "kaggle.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            cfg = json.load(f)
+        return cfg["username"], cfg["key"]
+    except (OSError, ValueError, KeyError) as e:
+        raise OSError(f"Could not read Kaggle credentials from {path}: {e}") from e
+
+
+class KaggleRestClient:
+    """Minimal Kaggle REST client that returns submissions as plain JSON dicts."""
+
+    def __init__(self, username: str, key: str):
+        self._session = _make_session(frozenset({"GET"}))
+        self._session.auth = HTTPBasicAuth(username, key)
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._cached: Dict[str, List[dict]] = {}
+
+    def competition_submissions(self, competition: str) -> List[dict]:
+        url = f"{KAGGLE_API_BASE}/competitions/submissions/list/{competition}"
+        resp = self._session.get(url, headers=self._validators.get(url), timeout=30)
+        if resp.status_code == 304:
+            return self._cached[url]
+        resp.raise_for_status()
+        subs = resp.json()
+
+        validators = _validators_from(resp.headers)
+        if validators:
+            # Validators are only sent while a cached body exists to go with them
+            self._validators[url] = validators
+            self._cached[url] = subs
+        return subs
+
+
+def authenticate_kaggle(use_sdk: bool = False) -> Any:
     """Authenticate Kaggle API using kaggle.json or env defaults."""
+    if not use_sdk:
+        return KaggleRestClient(*load_kaggle_credentials())
+    from kaggle.api.kaggle_api_extended import KaggleApi
     api = KaggleApi()
     api.authenticate()
     return api
 
 
+def install_conditional_cache(api: Any) -> Optional[_ConditionalPoolManager]:
+    """Enable conditional GETs on SDK versions that expose a urllib3 pool manager."""
+    rest_client = getattr(getattr(api, "api_client", None), "rest_client", None)
+    pool_manager = getattr(rest_client, "pool_manager", None)
+    if pool_manager is None:
+        return None
+    cache = _ConditionalPoolManager(pool_manager)
+    rest_client.pool_manager = cache
+    return cache
+
+
+def fetch_submissions(
+    api: Any,
+    competition: str,
+    cache: Optional[_ConditionalPoolManager],
+    previous: Optional[List[Any]],
+) -> List[Any]:
+    """Fetch submissions, reusing the previous list when the server answers 304."""
+    try:
+        return api.competition_submissions(competition)
+    except _NotModified:
+        if previous is not None:
+            return previous
+        # Validators without a parsed list to go with them: refetch unconditionally
+        if cache is not None:
+            cache.clear()
+        return api.competition_submissions(competition)
+
+
+def collect_notifications(
+    parsed: List[Tuple[int, str, datetime.datetime, Any]],
+    track: Dict[int, TrackEntry],
+    now_utc: datetime.datetime,
+) -> List[Tuple[str, List[dict]]]:
+    """Build Slack messages for refs whose status changed and mark them reported."""
+    pending: List[Tuple[str, List[dict]]] = []
+    for ref, seen, submit_dt, s in parsed:
+        info = track[ref]
+        reported = info.last_reported_status
+        if seen == reported:
+            continue
+
+        el_min = elapsed_minutes(submit_dt, now_utc)
+        link = info.url
+
+        if seen in ACTIVE_STATUSES:
+            msg = f":hourglass_flowing_sand: `{ref}` → *{seen}* / Elapsed {el_min} min\n<{link}|Open submission>"
+            pending.append((msg, [text_block(msg)]))
+        elif seen == "complete":
+            score_line = score_display(s)
+            blocks = _build_complete_blocks(ref, el_min, info.submit_jst, score_line, link)
+            pending.append((f"Submission complete — ref {ref}", blocks))
+        elif seen == "error":
+            err = get_attr(s, "_error_description", "errorDescription", default="(no detail)")
+            msg = f":x: `{ref}` → *error* / Elapsed {el_min} min\n```{err}```\n<{link}|Open submission>"
+            pending.append((msg, [text_block(msg)]))
+        else:
+            msg = f":information_source: `{ref}` → *{seen}* / Elapsed {el_min} min\n<{link}|Open submission>"
+            pending.append((msg, [text_block(msg)]))
+
+        info.last_reported_status = seen
+    return pending
+
+
 def run_watcher(
     webhook_url: str,
     competition: str,
     interval_min: int,
+    use_sdk: bool = False,
+    event_url: str = "",
+    state_file: Optional[str] = None,
 ) -> None:
     """Main watcher loop for Kaggle submissions."""
 
@@ -143,80 +567,159 @@ def run_watcher(
         raise ValueError("--interval-min must be >= 1")
 
     interval_sec = interval_min * 60
-    api = authenticate_kaggle()
-
-    track: Dict[int, Dict[str, Any]] = {}
+    active_interval = min(ACTIVE_INTERVAL_SEC, interval_sec)
+    idle_sleep = interval_sec
+    error_backoff = interval_sec
+    api = authenticate_kaggle(use_sdk)
+    cache = install_conditional_cache(api) if use_sdk else None
+    if event_url:
+        start_event_listener(event_url)
+    subs: Optional[List[Any]] = None
+
+    if state_file is None:
+        state_file = default_state_path(competition)
+    # finished_refs: refs already reported in a terminal state; pruned from track and ignored afterwards.
+    # A dict used as an insertion-ordered set so the oldest entries can be evicted.
+    track: Dict[int, TrackEntry]
+    finished_refs: Dict[int, None]
+    track, finished_refs = load_state(state_file) if state_file else ({}, {})
+    last_digest: Optional[int] = None
     slack_post(webhook_url, f":rocket: Watcher started — *{competition}*\nSubmissions: https://www.kaggle.com/competitions/{competition}/submissions")
 
     while True:
+        # Sleeps below are measured from here, so time spent polling and reporting does not add drift
+        cycle_start = time.monotonic()
+
         # Fetch submissions
         try:
-            subs = api.competition_submissions(competition)
+            subs = fetch_submissions(api, competition, cache, subs)
         except Exception as e:
             print("[WARN] Kaggle API error:", e)
-            time.sleep(interval_sec)
+            sleep_for = error_backoff
+            error_backoff = min(error_backoff * 2, interval_sec * 4)
+            # Plain sleep: pushed events must not cut the error backoff short
+            time.sleep(jittered(sleep_for))
             continue
+        error_backoff = interval_sec
 
-        # Update tracking
+        # Parse each submission once and update tracking
+        now_utc = datetime.datetime.now(_UTC)
+        dirty = False
+        parsed: List[Tuple[int, str, datetime.datetime, Any]] = []
         for s in subs:
             ref = get_ref(s)
-            if ref == -1:
+            if ref == -1 or ref in finished_refs:
                 continue
             seen = status_text(s)
-            submit_dt = get_attr(s, "_date", "date")
-            if submit_dt is None:
-                submit_dt = datetime.datetime.now(timezone.utc).replace(tzinfo=None)
-
-            if ref not in track:
-                track[ref] = {"submit_time": submit_dt, "last_seen_status": seen, "last_reported_status": None}
-                if seen == "complete":
-                    track[ref]["last_reported_status"] = "complete"
-            else:
-                track[ref]["last_seen_status"] = seen
-
-        # Report changed statuses
-        now_utc = datetime.datetime.now(timezone.utc).replace(tzinfo=None)
-        for s in subs:
-            ref = get_ref(s)
-            if ref == -1:
-                continue
             info = track.get(ref)
-            if not info:
+            if info is None:
+                # Fields that never change for a ref are computed once, on first sight
+                raw_date = get_attr(s, "_date", "date")
+                submit_dt = parse_utc(raw_date)
+                if submit_dt is None:
+                    print(f"[WARN] Unparseable submit time for ref {ref}: {raw_date!r}; using now")
+                    submit_dt = now_utc
+                info = track[ref] = TrackEntry(
+                    submit_time=submit_dt,
+                    submit_jst=fmt_jst(submit_dt),
+                    url=submission_url(s, competition),
+                    last_seen_status=seen,
+                    last_reported_status="complete" if seen == "complete" else None,
+                )
+                dirty = True
+            else:
+                info.last_seen_status = seen
+            parsed.append((ref, seen, info.submit_time, s))
+
+        # Report changed statuses; skipped when no (ref, status) pair differs from last cycle
+        cur_digest = hash(tuple(sorted((r, st) for r, st, _, _ in parsed)))
+        if cur_digest != last_digest:
+            # One Slack round-trip per cycle (split only when Slack's block limit is hit),
+            # delivered in the background so it overlaps with the sleep and next poll
+            pending = collect_notifications(parsed, track, now_utc)
+            slack_post_background(webhook_url, pending)
+            dirty = dirty or bool(pending)
+            last_digest = cur_digest
+
+        # Drop refs that stayed out of the listing or have been reported in a terminal state for a few cycles
+        listed = {r for r, _, _, _ in parsed}
+        for ref, info in list(track.items()):
+            if ref not in listed:
+                # Deleted, or pushed off the single page the listing returns
+                info.missing_cycles += 1
+                if info.missing_cycles > UNLISTED_GRACE_CYCLES:
+                    del track[ref]
+                dirty = True
                 continue
+            info.missing_cycles = 0
+            seen = info.last_seen_status
+            if seen in TERMINAL_STATUSES and seen == info.last_reported_status:
+                info.terminal_cycles += 1
+                if info.terminal_cycles > TERMINAL_GRACE_CYCLES:
+                    del track[ref]
+                    remember_finished(finished_refs, ref)
+                    dirty = True
+
+        if dirty and state_file:
+            save_state(state_file, track, finished_refs)
+
+        # Poll fast while something is in flight, then decay back to the idle interval
+        any_active = any(st in ACTIVE_STATUSES for _, st, _, _ in parsed)
+        if any_active:
+            idle_sleep = active_interval
+            sleep_for = active_interval
+        else:
+            idle_interval = interval_sec * EVENT_SAFETY_FACTOR if _EVENT_CONNECTED.is_set() else interval_sec
+            idle_sleep = min(idle_sleep * 2, idle_interval)
+            sleep_for = idle_sleep
+        wait_for_wake(cycle_start + active_interval, cycle_start + jittered(sleep_for))
 
-            seen = info["last_seen_status"]
-            reported = info["last_reported_status"]
-            if seen == reported:
-                continue
 
-            submit_time = info["submit_time"]
-            el_min = elapsed_minutes(submit_time, now_utc)
-            link = submission_url(s, competition)
-
-            if seen in {"pending", "queued", "running"}:
-                slack_post(webhook_url, f":hourglass_flowing_sand: `{ref}` → *{seen}* / Elapsed {el_min} min\n<{link}|Open submission>")
-            elif seen == "complete":
-                score_line = score_display(s)
-                blocks = [
-                    {"type": "section", "text": {"type": "mrkdwn", "text": ":white_check_mark: *Kaggle Submission Complete*"}},
-                    {"type": "section", "fields": [
-                        {"type": "mrkdwn", "text": f"*Ref:*\n`{ref}`"},
-                        {"type": "mrkdwn", "text": f"*Elapsed (Submit→Now):*\n{el_min} min"},
-                        {"type": "mrkdwn", "text": f"*Submitted (JST):*\n{fmt_jst(submit_time)}"},
-                    ]},
-                    {"type": "section", "text": {"type": "mrkdwn", "text": score_line}},
-                    {"type": "context", "elements": [{"type": "mrkdwn", "text": f"<{link}|Open submission>"}]}
-                ]
-                slack_post(webhook_url, text=f"Submission complete — ref {ref}", blocks=blocks)
-            elif seen == "error":
-                err = get_attr(s, "_error_description", "errorDescription", default="(no detail)")
-                slack_post(webhook_url, f":x: `{ref}` → *error* / Elapsed {el_min} min\n```{err}```\n<{link}|Open submission>")
-            else:
-                slack_post(webhook_url, f":information_source: `{ref}` → *{seen}* / Elapsed {el_min} min\n<{link}|Open submission>")
+# =========================
+# State persistence
+# =========================
+STATE_VERSION = 1
+
+
+def default_state_path(competition: str) -> str:
+    """Return ~/.cache/kaggle-notifier/<competition>.json."""
+    return os.path.join(os.path.expanduser("~"), ".cache", "kaggle-notifier", f"{competition}.json")
 
-            info["last_reported_status"] = seen
 
-        time.sleep(interval_sec)
+def load_state(path: str) -> Tuple[Dict[int, TrackEntry], Dict[int, None]]:
+    """Load tracking state saved by save_state; a missing or unreadable file means a fresh start."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"unsupported state version {state.get('version')!r}")
+        track = {int(ref): TrackEntry.from_dict(d) for ref, d in state["track"].items()}
+        finished_refs: Dict[int, None] = {}
+        for ref in state["finished_refs"]:
+            remember_finished(finished_refs, int(ref))
+        return track, finished_refs
+    except FileNotFoundError:
+        return {}, {}
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print("[WARN] Ignoring unreadable state file:", path, e)
+        return {}, {}
+
+
+def save_state(path: str, track: Dict[int, TrackEntry], finished_refs: Dict[int, None]) -> None:
+    """Atomically write tracking state so a restart does not re-notify."""
+    state = {
+        "version": STATE_VERSION,
+        "track": {str(ref): info.to_dict() for ref, info in track.items()},
+        "finished_refs": list(finished_refs),  # oldest first, so reloading keeps eviction order
+    }
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print("[WARN] Could not save state file:", path, e)
 
 
 # =========================
@@ -227,14 +730,18 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--competition", required=True, help="Kaggle competition slug (e.g., 'jigsaw-agile-community-rules').")
     parser.add_argument("--slack-webhook", default=os.environ.get("SLACK_WEBHOOK_URL", ""), help="Slack incoming webhook URL.")
     parser.add_argument("--interval-min", type=int, default=int(os.environ.get("INTERVAL_MIN", "10")), help="Interval in minutes for polling and reporting.")
+    parser.add_argument("--event-url", default=os.environ.get("EVENT_URL", ""), help="Optional JSON-lines/SSE stream whose events trigger an immediate refresh.")
+    parser.add_argument("--state-file", default=None, help="Where to persist tracking state across restarts (default: ~/.cache/kaggle-notifier/<competition>.json; '' disables).")
+    parser.add_argument("--use-sdk", action="store_true", help="List submissions through the kaggle package instead of the REST API.")
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
     try:
-        run_watcher(args.slack_webhook, args.competition, args.interval_min)
+        run_watcher(args.slack_webhook, args.competition, args.interval_min, args.use_sdk, args.event_url, args.state_file)
     except KeyboardInterrupt:
+        slack_flush()
         slack_post(args.slack_webhook, ":wave: Watcher stopped by user.")
         print("\n[INFO] Stopped by user.")
 
@@ -0,0 +1,149 @@
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("line, expected", [
+    ('{"ref": 42, "status": "complete"}', 42),
+    (b'{"ref": 42, "status": "complete"}', 42),
+    ('data: {"ref": 7}', 7),
+    (b'data: {"ref": "s-7"}', 7),
+    ("{}", -1),
+    ("", None),
+    (b"", None),
+    (": keep-alive", None),
+    ("event: status", None),
+    ("data: {broken", None),
+])
+def test_event_ref(line, expected):
+    assert main._event_ref(line) == expected
+
+
+class _StopStream(BaseException):
+    """Escapes stream_events' reconnect loop once the fake stream is exhausted."""
+
+
+class _FakeResponse:
+    def __init__(self, lines, encoding=None):
+        self._lines = lines
+        self.encoding = encoding
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self, decode_unicode=False):
+        for line in self._lines:
+            if decode_unicode and self.encoding:
+                line = line.decode(self.encoding)
+            yield line
+
+
+class _CountingWake:
+    def __init__(self):
+        self.count = 0
+
+    def set(self):
+        self.count += 1
+
+
+def _run_stream(monkeypatch, resp):
+    """Run stream_events over one fake connection and return how many wakes it sent."""
+    if resp is not None:
+        monkeypatch.setattr(main.requests, "get", lambda *a, **kw: resp)
+
+    def stop(_seconds):
+        raise _StopStream
+
+    monkeypatch.setattr(main.time, "sleep", stop)
+    wake = _CountingWake()
+    monkeypatch.setattr(main, "_WAKE", wake)
+    with pytest.raises(_StopStream):
+        main.stream_events("http://relay")
+    return wake.count
+
+
+def test_stream_events_without_declared_encoding(monkeypatch):
+    resp = _FakeResponse([b'{"ref": 1}', b"", b'data: {"ref": 2}'])
+    assert _run_stream(monkeypatch, resp) == 2
+    assert resp.encoding == "utf-8"
+
+
+def test_stream_events_with_declared_encoding(monkeypatch):
+    resp = _FakeResponse([b'{"ref": 3}'], encoding="utf-8")
+    assert _run_stream(monkeypatch, resp) == 1
+
+
+def test_stream_events_tracks_connection_state(monkeypatch):
+    seen = []
+    captured = {}
+
+    class _DroppedResponse(_FakeResponse):
+        def iter_lines(self, decode_unicode=False):
+            seen.append(main._EVENT_CONNECTED.is_set())
+            raise main.requests.ConnectionError("read timed out")
+
+    def fake_get(*args, **kwargs):
+        captured.update(kwargs)
+        return _DroppedResponse([])
+
+    monkeypatch.setattr(main.requests, "get", fake_get)
+    assert _run_stream(monkeypatch, None) == 0
+    assert seen == [True]
+    assert not main._EVENT_CONNECTED.is_set()
+    assert captured["timeout"][1] is not None
+
+
+def test_stream_events_ignores_events_without_ref(monkeypatch):
+    resp = _FakeResponse([b"{}", b'data: {"competition": "other"}', b'{"ref": 5}'])
+    assert _run_stream(monkeypatch, resp) == 1
+
+
+def test_wait_for_wake_enforces_floor(monkeypatch):
+    clock = [100.0]
+    slept = []
+
+    class _EarlyWake:
+        def wait(self, timeout):
+            clock[0] += 1  # an event arrived one second in
+            return True
+
+        def clear(self):
+            pass
+
+    def fake_sleep(seconds):
+        slept.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(main, "_WAKE", _EarlyWake())
+    monkeypatch.setattr(main.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(main.time, "sleep", fake_sleep)
+    main.wait_for_wake(not_before=115.0, deadline=700.0)
+    assert slept == [14.0]
+    assert clock[0] == 115.0
+
+
+def test_wait_for_wake_timeout_keeps_short_jitter(monkeypatch):
+    clock = [100.0]
+    slept = []
+
+    class _NoEvent:
+        def wait(self, timeout):
+            clock[0] += timeout
+            return False
+
+        def clear(self):
+            pass
+
+    monkeypatch.setattr(main, "_WAKE", _NoEvent())
+    monkeypatch.setattr(main.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(main.time, "sleep", slept.append)
+    # A jittered active sleep of 12.75 s must not be stretched to the 15 s event floor
+    main.wait_for_wake(not_before=115.0, deadline=112.75)
+    assert slept == []
+    assert clock[0] == 112.75
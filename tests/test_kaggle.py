@@ -0,0 +1,101 @@
+import pytest
+
+import main
+
+
+class _RestResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise main.requests.HTTPError(str(self.status_code))
+
+    def json(self):
+        return self._body
+
+
+def _rest_client(responses, sent):
+    client = main.KaggleRestClient("user", "key")
+
+    def fake_get(url, headers=None, timeout=None):
+        sent.append(headers)
+        return responses.pop(0)
+
+    client._session.get = fake_get
+    return client
+
+
+def test_rest_client_reuses_cached_list_on_304():
+    subs = [{"ref": 1, "status": "pending"}]
+    sent = []
+    client = _rest_client([_RestResponse(200, subs, {"ETag": '"v1"'}), _RestResponse(304)], sent)
+    assert client.competition_submissions("comp") == subs
+    assert client.competition_submissions("comp") is subs
+    assert sent == [None, {"If-None-Match": '"v1"'}]
+
+
+def test_rest_client_without_validators_sends_unconditional_requests():
+    sent = []
+    client = _rest_client([_RestResponse(200, []), _RestResponse(200, [{"ref": 2}])], sent)
+    client.competition_submissions("comp")
+    assert client.competition_submissions("comp") == [{"ref": 2}]
+    assert sent == [None, None]
+
+
+class _PoolResponse:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.released = False
+
+    def release_conn(self):
+        self.released = True
+
+
+class _FakePool:
+    def __init__(self, responses):
+        self.responses = responses
+        self.sent = []
+
+    def request(self, method, url, **kwargs):
+        self.sent.append(kwargs.get("headers"))
+        return self.responses.pop(0)
+
+
+def test_conditional_pool_manager_sends_validators_and_raises_on_304():
+    pool = _FakePool([_PoolResponse(200, {"Last-Modified": "Tue, 13 Oct 2026 00:00:00 GMT"}), _PoolResponse(304)])
+    cache = main._ConditionalPoolManager(pool)
+    cache.request("GET", "http://k/list", headers={"A": "b"}, fields=[("page", 1)])
+    with pytest.raises(main._NotModified):
+        cache.request("GET", "http://k/list", headers={"A": "b"}, fields=[("page", 1)])
+    assert pool.sent[1] == {"A": "b", "If-Modified-Since": "Tue, 13 Oct 2026 00:00:00 GMT"}
+
+
+def test_conditional_pool_manager_releases_connection_on_304():
+    not_modified = _PoolResponse(304)
+    pool = _FakePool([_PoolResponse(200, {"ETag": "x"}), not_modified])
+    cache = main._ConditionalPoolManager(pool)
+    cache.request("GET", "http://k/list", preload_content=False)
+    with pytest.raises(main._NotModified):
+        cache.request("GET", "http://k/list", preload_content=False)
+    assert not_modified.released
+
+
+def test_conditional_pool_manager_passes_through_non_get():
+    pool = _FakePool([_PoolResponse(200, {"ETag": "x"})])
+    cache = main._ConditionalPoolManager(pool)
+    cache.request("POST", "http://k/submit", headers={"A": "b"})
+    assert pool.sent == [{"A": "b"}]
+    assert cache._validators == {}
+
+
+def test_fetch_submissions_reuses_previous_on_not_modified():
+    class _Api:
+        def competition_submissions(self, competition):
+            raise main._NotModified(competition)
+
+    previous = [{"ref": 1}]
+    assert main.fetch_submissions(_Api(), "comp", None, previous) is previous
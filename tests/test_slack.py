@@ -0,0 +1,34 @@
+import main
+
+
+def test_slack_post_batch_single_post(monkeypatch):
+    posts = []
+    monkeypatch.setattr(main, "slack_post", lambda url, text, blocks=None: posts.append((text, blocks)))
+    main.slack_post_batch("http://hook", [("a", [main.text_block("a")]), ("b", [main.text_block("b")])])
+    assert len(posts) == 1
+    text, blocks = posts[0]
+    assert text == "a\nb"
+    assert [b["type"] for b in blocks] == ["section", "divider", "section"]
+
+
+def test_slack_post_batch_splits_at_block_limit(monkeypatch):
+    posts = []
+    monkeypatch.setattr(main, "slack_post", lambda url, text, blocks=None: posts.append(blocks))
+    complete = main._build_complete_blocks(1, 5, "2026-10-14 09:00:00", "Public LB: *0.9*", "http://x")
+    main.slack_post_batch("http://hook", [("done", complete)] * 20)
+    assert len(posts) > 1
+    assert all(len(blocks) <= main.SLACK_MAX_BLOCKS for blocks in posts)
+    assert sum(1 for blocks in posts for b in blocks if b["type"] != "divider") == 20 * len(complete)
+    assert all(blocks[0]["type"] != "divider" for blocks in posts)
+
+
+def test_slack_post_batch_empty(monkeypatch):
+    posts = []
+    monkeypatch.setattr(main, "slack_post", lambda *a, **kw: posts.append(a))
+    main.slack_post_batch("http://hook", [])
+    assert posts == []
+
+
+def test_text_block_truncates():
+    block = main.text_block("x" * (main.SLACK_MAX_SECTION_TEXT + 10))
+    assert len(block["text"]["text"]) == main.SLACK_MAX_SECTION_TEXT
@@ -0,0 +1,51 @@
+import datetime
+import json
+
+import main
+
+
+def _entry(submit_time):
+    return {
+        "submit_time": submit_time,
+        "submit_jst": "2026-10-14 09:00:00",
+        "url": "https://www.kaggle.com/competitions/comp/submissions",
+        "last_seen_status": "pending",
+        "last_reported_status": "pending",
+    }
+
+
+def _write(tmp_path, track):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"version": main.STATE_VERSION, "track": track, "finished_refs": [9]}))
+    return str(path)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "nested" / "state.json")
+    submit = datetime.datetime(2026, 10, 14, tzinfo=main._UTC)
+    track = {1: main.TrackEntry(submit, "2026-10-14 09:00:00", "u", "pending", "pending")}
+    main.save_state(path, track, {9: None, 4: None})
+    loaded, finished = main.load_state(path)
+    assert loaded == track
+    assert list(finished) == [9, 4]
+
+
+def test_load_state_normalizes_naive_timestamps(tmp_path):
+    path = _write(tmp_path, {"1": _entry("2026-10-14T00:00:00")})
+    track, _ = main.load_state(path)
+    submit = track[1].submit_time
+    assert submit.tzinfo is not None
+    assert main.elapsed_minutes(submit, datetime.datetime.now(main._UTC)) >= 1
+
+
+def test_load_state_ignores_bad_timestamps(tmp_path):
+    path = _write(tmp_path, {"1": _entry("not a date")})
+    assert main.load_state(path) == ({}, {})
+
+
+def test_finished_refs_are_capped(monkeypatch):
+    monkeypatch.setattr(main, "FINISHED_REFS_MAX", 3)
+    finished = {}
+    for ref in range(5):
+        main.remember_finished(finished, ref)
+    assert list(finished) == [2, 3, 4]
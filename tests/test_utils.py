@@ -0,0 +1,26 @@
+import datetime
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("raw, second, micro", [
+    ("2024-03-12T05:27:15.59Z", 15, 590000),
+    ("2024-03-12T05:27:02.0633333Z", 2, 63333),
+    ("2024-03-12T05:27:02.123Z", 2, 123000),
+    ("2024-03-12T05:27:02Z", 2, 0),
+])
+def test_parse_utc_fraction_lengths(raw, second, micro):
+    expected = datetime.datetime(2024, 3, 12, 5, 27, second, micro, tzinfo=main._UTC)
+    assert main.parse_utc(raw) == expected
+
+
+def test_parse_utc_naive_and_offset():
+    assert main.parse_utc("2024-03-12T05:27:02").tzinfo is main._UTC
+    assert main.parse_utc("2024-03-12T14:27:02+09:00") == datetime.datetime(2024, 3, 12, 5, 27, 2, tzinfo=main._UTC)
+
+
+@pytest.mark.parametrize("raw", ["not a date", None, 12])
+def test_parse_utc_rejects_garbage(raw):
+    assert main.parse_utc(raw) is None
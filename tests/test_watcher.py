@@ -0,0 +1,86 @@
+import pytest
+
+import main
+
+
+class _StopWatcher(BaseException):
+    """Raised by the fake API once its scripted listings are used up."""
+
+
+class _FakeApi:
+    def __init__(self, listings):
+        self._listings = list(listings)
+
+    def competition_submissions(self, competition):
+        if not self._listings:
+            raise _StopWatcher
+        return self._listings.pop(0)
+
+
+def _run(monkeypatch, listings, saves=None):
+    """Run run_watcher over scripted listings and return the batches it posted."""
+    batches = []
+    state_file = ""
+    if saves is not None:
+        state_file = "unused.json"
+        monkeypatch.setattr(main, "load_state", lambda path: ({}, {}))
+        monkeypatch.setattr(main, "save_state", lambda path, track, finished: saves.append((dict(track), list(finished))))
+    monkeypatch.setattr(main, "authenticate_kaggle", lambda *a: _FakeApi(listings))
+    monkeypatch.setattr(main, "slack_post", lambda *a, **kw: None)
+    monkeypatch.setattr(main, "slack_post_background", lambda url, msgs: batches.append(msgs))
+    monkeypatch.setattr(main, "wait_for_wake", lambda *a: None)
+    with pytest.raises(_StopWatcher):
+        main.run_watcher("http://hook", "comp", 1, state_file=state_file)
+    return [[text for text, _ in batch] for batch in batches]
+
+
+def _sub(ref, status, **extra):
+    return {"ref": ref, "status": status, "date": "2026-10-14T00:00:00Z", **extra}
+
+
+def test_completion_reported_after_ref_missing_from_one_listing(monkeypatch):
+    batches = _run(monkeypatch, [
+        [_sub(1, "pending")],
+        [],
+        [_sub(1, "complete", publicScore="0.9")],
+        [_sub(1, "complete", publicScore="0.9")],
+    ])
+    texts = [t for batch in batches for t in batch]
+    assert any("`1` → *pending*" in t for t in texts)
+    assert "Submission complete — ref 1" in texts
+
+
+def test_reports_each_transition_in_one_batch(monkeypatch):
+    batches = _run(monkeypatch, [
+        [_sub(1, "pending"), _sub(2, "complete")],
+        [_sub(1, "complete", publicScore="0.9"), _sub(2, "complete"), _sub(3, "error", errorDescription="boom")],
+    ])
+    # ref 2 was already complete on first sight, so it is never announced
+    assert len(batches[0]) == 1
+    assert "`1` → *pending*" in batches[0][0]
+    assert batches[1][0] == "Submission complete — ref 1"
+    assert "`3` → *error*" in batches[1][1]
+    assert "boom" in batches[1][1]
+    assert len(batches) == 2
+
+
+def test_unchanged_listing_skips_reporting(monkeypatch):
+    calls = []
+    real = main.collect_notifications
+
+    def counting(*args):
+        calls.append(1)
+        return real(*args)
+
+    monkeypatch.setattr(main, "collect_notifications", counting)
+    _run(monkeypatch, [[_sub(1, "pending")]] * 3 + [[_sub(1, "running")]])
+    assert len(calls) == 2
+
+
+def test_terminal_refs_are_pruned_and_ignored(monkeypatch):
+    saves = []
+    batches = _run(monkeypatch, [[_sub(1, "error", errorDescription="boom")]] * 6, saves=saves)
+    assert len([t for batch in batches for t in batch]) == 1
+    track, finished = saves[-1]
+    assert track == {}
+    assert finished == [1]